@@ -8,12 +8,43 @@ Date: June 2025
 """
 
 from typing import List, Any, Optional, Tuple
+from bisect import bisect_left
+import math
+import os
+import sys
 import time
-from functools import wraps
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, wraps
+from itertools import chain
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; pure-Python paths are used instead
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; NumPy/pure-Python paths are used instead
+    njit = None
 
 
 def timer(func):
-    """Decorator to measure execution time."""
+    """
+    Decorator to measure execution time.
+    
+    Returns func unchanged when the NOTIMER environment variable is set
+    or Python runs with -O, so timed code pays nothing in production.
+    Apply it to top-level entry points only; never to per-element helpers
+    such as _merge_into or _heapify, where the perf_counter calls and
+    print would dominate the loop.
+    """
+    if os.environ.get("NOTIMER") or not __debug__:
+        return func
+    return _timer_impl(func)
+
+
+def _timer_impl(func):
+    """Wrap func to print its wall-clock time on every call."""
     @wraps(func)
     def wrapper(*args, **kwargs):
         start = time.perf_counter()
@@ -24,42 +55,182 @@ def timer(func):
     return wrapper
 
 
+# Range of values an int64 NumPy array holds exactly
+_INT64_MIN = -2 ** 63
+_INT64_MAX = 2 ** 63 - 1
+
+
+def _as_numeric_array(arr: List[Any]) -> Optional["np.ndarray"]:
+    """
+    Copy arr into a typed NumPy array if that keeps every value exact.
+    
+    Only all-int input that fits in int64 and all-float input qualify, so
+    tolist() hands back the same values and types. Returns None when
+    NumPy is unavailable or for anything else (strings, bools, ints mixed
+    with floats, ints outside int64, ...).
+    """
+    if np is None or len(arr) == 0:
+        return None
+    types = set(map(type, arr))
+    if types == {int}:
+        if min(arr) < _INT64_MIN or max(arr) > _INT64_MAX:
+            return None
+        return np.array(arr, dtype=np.int64)
+    if types == {float}:
+        return np.array(arr, dtype=np.float64)
+    return None
+
+
 # ============================================================================
 # SORTING ALGORITHMS
 # ============================================================================
 
+# Ranges of at most this many items are finished with a sorting network
+_NETWORK_MAX = 16
+
+# Inputs shorter than this are not worth shipping to worker processes
+# (measured break-even against merge_sort on strings/tuples: ~10k-20k)
+_PARALLEL_THRESHOLD = 20_000
+
+
 def quick_sort(arr: List[int]) -> List[int]:
     """
     Quick Sort implementation.
     
-    Time Complexity: O(n log n) average, O(n²) worst case
+    Numeric input is copied once into a typed NumPy array and sorted with
+    np.sort(kind='quicksort'), which NumPy dispatches to a SIMD-vectorized
+    quicksort on supported CPUs. Other input is copied into a list and
+    sorted in place with introsort, which falls back to heap sort when
+    partitioning degrades.
+    
+    Time Complexity: O(n log n) average and worst case
     Space Complexity: O(log n) due to recursion
     
     Args:
         arr: List to sort
-        
+    
     Returns:
         Sorted list
     """
-    if len(arr) <= 1:
-        return arr
+    arr_np = _as_numeric_array(arr)
+    if arr_np is not None:
+        arr_np.sort(kind='quicksort')
+        return arr_np.tolist()
+    
+    buf = list(arr)
+    depth_limit = 2 * int(math.log2(max(len(buf), 1)))
+    _introsort(buf, 0, len(buf) - 1, depth_limit)
+    return buf
+
+
+def _introsort(buf: List[Any], lo: int, hi: int, depth_limit: int) -> None:
+    """
+    Sort buf[lo:hi + 1] in place with introsort.
     
-    # Choose pivot (middle element)
-    pivot = arr[len(arr) // 2]
+    Quick sort with Hoare partitioning and a median-of-3 pivot, switching
+    to heap sort once depth_limit partitions have been spent (guarding
+    against O(n²) inputs) and to a sorting network for short ranges. The
+    smaller partition is handled recursively and the larger one by
+    looping, which bounds the recursion depth to O(log n).
+    """
+    while hi - lo >= _NETWORK_MAX:
+        if depth_limit == 0:
+            _heap_sort_range(buf, lo, hi)
+            return
+        depth_limit -= 1
+        
+        # Median-of-3: order the first, middle and last elements
+        mid = (lo + hi) // 2
+        if buf[mid] < buf[lo]:
+            buf[lo], buf[mid] = buf[mid], buf[lo]
+        if buf[hi] < buf[lo]:
+            buf[lo], buf[hi] = buf[hi], buf[lo]
+        if buf[hi] < buf[mid]:
+            buf[mid], buf[hi] = buf[hi], buf[mid]
+        pivot = buf[mid]
+        
+        # Hoare partition: single pass with two cursors moving inwards
+        i, j = lo - 1, hi + 1
+        while True:
+            i += 1
+            while buf[i] < pivot:
+                i += 1
+            j -= 1
+            while buf[j] > pivot:
+                j -= 1
+            if i >= j:
+                break
+            buf[i], buf[j] = buf[j], buf[i]
+        
+        # Recurse on the smaller side, loop on the larger
+        if j - lo < hi - j:
+            _introsort(buf, lo, j, depth_limit)
+            lo = j + 1
+        else:
+            _introsort(buf, j + 1, hi, depth_limit)
+            hi = j
     
-    # Partition into three parts
-    left = [x for x in arr if x < pivot]
-    middle = [x for x in arr if x == pivot]
-    right = [x for x in arr if x > pivot]
+    if hi > lo:
+        _NET[hi - lo + 1](buf, lo)
+
+
+def _batcher_pairs(n: int) -> List[Tuple[int, int]]:
+    """
+    Compare-swap pairs of Batcher's odd-even merge sort for n items.
+    
+    The network is built for the next power of two and comparators that
+    touch indices >= n are dropped (those slots act as +infinity).
+    """
+    size = 1
+    while size < n:
+        size *= 2
+    
+    pairs = []
+    p = 1
+    while p < size:
+        k = p
+        while k >= 1:
+            for j in range(k % p, size - k, 2 * k):
+                for i in range(min(k, size - j - k)):
+                    if (i + j) // (2 * p) == (i + j + k) // (2 * p) and i + j + k < n:
+                        pairs.append((i + j, i + j + k))
+            k //= 2
+        p *= 2
+    
+    return pairs
+
+
+def _make_sorting_network(n: int):
+    """
+    Generate straight-line code sorting buf[lo:lo + n] in place.
     
-    # Recursively sort and combine
-    return quick_sort(left) + middle + quick_sort(right)
+    The items are loaded into locals, run through the network's
+    compare-swaps, and stored back with a single slice assignment.
+    """
+    names = [f"x{k}" for k in range(n)]
+    lines = ["def _net(buf, lo):",
+             f"    {', '.join(names)} = buf[lo:lo + {n}]"]
+    for a, b in _batcher_pairs(n):
+        lines.append(f"    if x{b} < x{a}: x{a}, x{b} = x{b}, x{a}")
+    lines.append(f"    buf[lo:lo + {n}] = {', '.join(names)}")
+    
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["_net"]
+
+
+# Sorting networks for 2.._NETWORK_MAX items, keyed by length
+_NET = {n: _make_sorting_network(n) for n in range(2, _NETWORK_MAX + 1)}
 
 
 def merge_sort(arr: List[int]) -> List[int]:
     """
     Merge Sort implementation.
     
+    Numeric input is sorted with np.sort(kind='mergesort'), NumPy's stable
+    C merge sort. Other input is merged bottom-up between two
+    preallocated buffers.
+    
     Time Complexity: O(n log n) all cases
     Space Complexity: O(n)
     
@@ -69,37 +240,96 @@ def merge_sort(arr: List[int]) -> List[int]:
     Returns:
         Sorted list
     """
-    if len(arr) <= 1:
-        return arr
+    arr_np = _as_numeric_array(arr)
+    if arr_np is not None:
+        return np.sort(arr_np, kind='mergesort').tolist()
     
-    # Divide
-    mid = len(arr) // 2
-    left = merge_sort(arr[:mid])
-    right = merge_sort(arr[mid:])
+    return _merge_sort(arr)
+
+
+def _merge_sort(arr: List[Any]) -> List[Any]:
+    """
+    Bottom-up merge sort for arbitrary comparable items.
     
-    # Conquer (merge)
-    return _merge(left, right)
+    Runs of width 1, 2, 4, ... are merged back and forth between two
+    buffers of size n, so no per-level slices are allocated.
+    """
+    n = len(arr)
+    src = list(arr)
+    dst = [None] * n
+    width = 1
+    
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            _merge_into(src, dst, lo, mid, hi)
+        src, dst = dst, src
+        width *= 2
+    
+    return src
 
 
-def _merge(left: List[int], right: List[int]) -> List[int]:
-    """Helper function to merge two sorted lists."""
-    result = []
-    i = j = 0
+def _merge_into(src: List[Any], dst: List[Any], lo: int, mid: int, hi: int) -> None:
+    """Merge sorted runs src[lo:mid] and src[mid:hi] into dst[lo:hi]."""
+    i, j, k = lo, mid, lo
     
-    # Merge while both lists have elements
-    while i < len(left) and j < len(right):
-        if left[i] <= right[j]:
-            result.append(left[i])
+    while i < mid and j < hi:
+        if src[i] <= src[j]:
+            dst[k] = src[i]
             i += 1
         else:
-            result.append(right[j])
+            dst[k] = src[j]
             j += 1
+        k += 1
+    
+    # Copy whichever run is left over
+    if i < mid:
+        dst[k:hi] = src[i:mid]
+    else:
+        dst[k:hi] = src[j:hi]
+
+
+def merge_sort_parallel(arr: List[int], workers: Optional[int] = None) -> List[int]:
+    """
+    Merge Sort that sorts chunks in separate processes.
+    
+    The input is split into one chunk per worker and each chunk is sorted
+    in its own process, sidestepping the GIL. The parent then merges the
+    sorted runs with one Timsort pass, which detects them and merges them
+    in C. Numeric input goes to merge_sort instead, because NumPy's C sort
+    beats the pickling round trip to the workers. So do inputs smaller
+    than _PARALLEL_THRESHOLD.
+    
+    Time Complexity: O(n log n) all cases
+    Space Complexity: O(n)
+    
+    Args:
+        arr: List to sort (items must be picklable)
+        workers: Number of worker processes (default: os.cpu_count())
+    
+    Returns:
+        Sorted list
+    """
+    workers = workers or os.cpu_count() or 1
+    if len(arr) < _PARALLEL_THRESHOLD or workers < 2:
+        return merge_sort(arr)
+    
+    # merge_sort redoes the conversion, which is O(n) next to the sort
+    if _as_numeric_array(arr) is not None:
+        return merge_sort(arr)
+    
+    # Split into `workers` nearly equal chunks
+    n = len(arr)
+    bounds = [n * k // workers for k in range(workers + 1)]
+    chunks = [arr[bounds[k]:bounds[k + 1]] for k in range(workers)]
     
-    # Add remaining elements
-    result.extend(left[i:])
-    result.extend(right[j:])
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        runs = list(executor.map(sorted, chunks))
     
-    return result
+    # Timsort finds the presorted runs and galloping-merges them in C,
+    # stably with earlier chunks winning ties
+    return sorted(chain.from_iterable(runs))
 
 
 def heap_sort(arr: List[int]) -> List[int]:
@@ -115,7 +345,7 @@ def heap_sort(arr: List[int]) -> List[int]:
     Returns:
         Sorted list
     """
-    arr = arr.copy()  # Don't modify original
+    arr = list(arr)  # Don't modify original
     n = len(arr)
     
     # Build max heap
@@ -130,21 +360,123 @@ def heap_sort(arr: List[int]) -> List[int]:
     return arr
 
 
-def _heapify(arr: List[int], n: int, i: int) -> None:
-    """Helper function to maintain max heap property."""
-    largest = i
-    left = 2 * i + 1
-    right = 2 * i + 2
+def comb_sort(arr: List[int]) -> List[int]:
+    """
+    Comb Sort implementation.
+    
+    Bubble-style compare-swap passes over a gap that shrinks by 1.3 each
+    round, finished by an insertion sort once the gap reaches 1. The
+    strided compare-swap loop is simple enough for Numba to compile into
+    vectorized code, which is used for numeric input when available.
+    
+    Time Complexity: O(n log n) typical, O(n²) worst case
+    Space Complexity: O(1)
+    
+    Args:
+        arr: List to sort
     
-    if left < n and arr[left] > arr[largest]:
-        largest = left
+    Returns:
+        Sorted list
+    """
+    if njit is not None:
+        arr_np = _as_numeric_array(arr)
+        if arr_np is not None:
+            _comb_sort_nb(arr_np)
+            return arr_np.tolist()
+    
+    buf = list(arr)
+    _comb_sort_inplace(buf)
+    return buf
+
+
+def _comb_sort_inplace(a) -> None:
+    """Comb sort a list or 1-D array in place."""
+    n = len(a)
+    gap = n
+    
+    while True:
+        gap = int(gap / 1.3)
+        if gap <= 1:
+            break
+        for i in range(n - gap):
+            if a[i + gap] < a[i]:
+                a[i], a[i + gap] = a[i + gap], a[i]
+    
+    # Final gap-1 pass as insertion sort; items are now close to place
+    for i in range(1, n):
+        item = a[i]
+        j = i - 1
+        while j >= 0 and a[j] > item:
+            a[j + 1] = a[j]
+            j -= 1
+        a[j + 1] = item
+
+
+if njit is not None:
+    _comb_sort_nb = njit(cache=True)(_comb_sort_inplace)
+
+
+def _heap_sort_range(buf: List[Any], lo: int, hi: int) -> None:
+    """Heap sort buf[lo:hi + 1] in place."""
+    n = hi - lo + 1
     
-    if right < n and arr[right] > arr[largest]:
-        largest = right
+    for i in range(n // 2 - 1, -1, -1):
+        _sift_down_range(buf, lo, n, i)
     
-    if largest != i:
+    for i in range(n - 1, 0, -1):
+        buf[lo], buf[lo + i] = buf[lo + i], buf[lo]
+        _sift_down_range(buf, lo, i, 0)
+
+
+def _sift_down_range(buf: List[Any], lo: int, n: int, i: int) -> None:
+    """
+    Sift buf[lo + i] down within the heap stored at buf[lo:lo + n].
+    
+    The offset variant of _heapify for introsort's fallback, kept
+    separate so heap_sort does not pay for the index arithmetic.
+    """
+    root = lo + i
+    end = lo + n
+    while True:
+        largest = root
+        left = 2 * root - lo + 1
+        right = left + 1
+        
+        if left < end and buf[left] > buf[largest]:
+            largest = left
+        
+        if right < end and buf[right] > buf[largest]:
+            largest = right
+        
+        if largest == root:
+            return
+        
+        buf[root], buf[largest] = buf[largest], buf[root]
+        root = largest
+
+
+def _heapify(arr: List[int], n: int, i: int) -> None:
+    """
+    Helper function to maintain max heap property.
+    
+    Sifts arr[i] down iteratively instead of recursing per level.
+    """
+    while True:
+        largest = i
+        left = 2 * i + 1
+        right = 2 * i + 2
+        
+        if left < n and arr[left] > arr[largest]:
+            largest = left
+        
+        if right < n and arr[right] > arr[largest]:
+            largest = right
+        
+        if largest == i:
+            return
+        
         arr[i], arr[largest] = arr[largest], arr[i]
-        _heapify(arr, n, largest)
+        i = largest
 
 
 # ============================================================================
@@ -155,6 +487,10 @@ def binary_search(arr: List[int], target: int) -> int:
     """
     Binary Search implementation.
     
+    Delegates the halving loop to bisect.bisect_left, which runs in C.
+    For batches of queries against a NumPy array, np.searchsorted is the
+    vectorized equivalent.
+    
     Time Complexity: O(log n)
     Space Complexity: O(1)
     
@@ -163,20 +499,12 @@ def binary_search(arr: List[int], target: int) -> int:
         target: Value to find
         
     Returns:
-        Index of target or -1 if not found
+        Index of the first occurrence of target or -1 if not found
     """
-    left, right = 0, len(arr) - 1
-    
-    while left <= right:
-        mid = (left + right) // 2
-        
-        if arr[mid] == target:
-            return mid
-        elif arr[mid] < target:
-            left = mid + 1
-        else:
-            right = mid - 1
+    i = bisect_left(arr, target)
     
+    if i < len(arr) and arr[i] == target:
+        return i
     return -1
 
 
@@ -184,16 +512,27 @@ def linear_search(arr: List[Any], target: Any) -> int:
     """
     Linear Search implementation.
     
+    A numeric NumPy array is searched with one vectorized comparison
+    (arr == target) instead of a Python loop. For many lookups in the
+    same data, building a {value: index} dict once gives O(1) queries.
+    
     Time Complexity: O(n)
-    Space Complexity: O(1)
+    Space Complexity: O(1), O(n) for the NumPy mask
     
     Args:
-        arr: List to search
+        arr: List (or 1-D NumPy array) to search
         target: Value to find
         
     Returns:
         Index of target or -1 if not found
     """
+    if (np is not None and isinstance(arr, np.ndarray) and arr.ndim == 1
+            and arr.dtype.kind in 'iuf' and isinstance(target, (int, float))):
+        mask = arr == target
+        if not mask.any():
+            return -1
+        return int(mask.argmax())
+    
     for i, val in enumerate(arr):
         if val == target:
             return i
@@ -206,10 +545,13 @@ def linear_search(arr: List[Any], target: Any) -> int:
 
 def fibonacci(n: int) -> int:
     """
-    Calculate nth Fibonacci number using dynamic programming.
+    Calculate nth Fibonacci number using fast doubling.
     
-    Time Complexity: O(n)
-    Space Complexity: O(1)
+    Uses F(2k) = F(k) * (2F(k+1) - F(k)) and F(2k+1) = F(k)² + F(k+1)²,
+    halving n at every step.
+    
+    Time Complexity: O(log n) big-int multiplications
+    Space Complexity: O(log n) due to recursion
     
     Args:
         n: Position in Fibonacci sequence
@@ -220,20 +562,32 @@ def fibonacci(n: int) -> int:
     if n <= 1:
         return n
     
-    prev, curr = 0, 1
-    
-    for _ in range(2, n + 1):
-        prev, curr = curr, prev + curr
-    
-    return curr
+    return _fib_doubling(n)[0]
+
+
+def _fib_doubling(n: int) -> Tuple[int, int]:
+    """Return (F(n), F(n + 1))."""
+    if n == 0:
+        return (0, 1)
+    
+    a, b = _fib_doubling(n >> 1)
+    c = a * ((b << 1) - a)  # F(2k)
+    d = a * a + b * b       # F(2k + 1)
+    
+    if n & 1:
+        return (d, c + d)
+    return (c, d)
 
 
 def longest_common_subsequence(s1: str, s2: str) -> int:
     """
     Find length of longest common subsequence between two strings.
     
+    With Numba available the DP runs as a compiled loop over two rows;
+    with only NumPy each row is computed with whole-row vector operations.
+    
     Time Complexity: O(m * n)
-    Space Complexity: O(m * n)
+    Space Complexity: O(n) with Numba/NumPy, O(m * n) otherwise
     
     Args:
         s1: First string
@@ -242,6 +596,13 @@ def longest_common_subsequence(s1: str, s2: str) -> int:
     Returns:
         Length of LCS
     """
+    if njit is not None:
+        if not s1 or not s2:
+            return 0
+        return int(_lcs_nb(_code_points(s1), _code_points(s2)))
+    if np is not None:
+        return _lcs_numpy(s1, s2)
+    
     m, n = len(s1), len(s2)
     
     # Create DP table
@@ -258,12 +619,79 @@ def longest_common_subsequence(s1: str, s2: str) -> int:
     return dp[m][n]
 
 
+def _code_points(s: str) -> "np.ndarray":
+    """
+    Return s as a uint32 array with one Unicode code point per element.
+    
+    Lone surrogates (e.g. from os.fsdecode) are kept as their code point
+    rather than raising UnicodeEncodeError.
+    """
+    return np.frombuffer(s.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+
+
+def _lcs_nb(a: "np.ndarray", b: "np.ndarray") -> int:
+    """LCS length over two code-point arrays using two rolling rows."""
+    n = b.shape[0]
+    prev = np.zeros(n + 1, dtype=np.int64)
+    curr = np.zeros(n + 1, dtype=np.int64)
+    
+    for i in range(a.shape[0]):
+        ai = a[i]
+        for j in range(1, n + 1):
+            if ai == b[j - 1]:
+                curr[j] = prev[j - 1] + 1
+            elif prev[j] >= curr[j - 1]:
+                curr[j] = prev[j]
+            else:
+                curr[j] = curr[j - 1]
+        prev, curr = curr, prev
+    
+    return prev[n]
+
+
+def _lcs_numpy(s1: str, s2: str) -> int:
+    """
+    Row-vectorized LCS length.
+    
+    Rows are non-decreasing, so the usual recurrence
+    dp[i][j] = max(dp[i-1][j], dp[i][j-1], dp[i-1][j-1] + match) unrolls
+    to a running maximum along the row, which np.maximum.accumulate does
+    in one pass.
+    """
+    if not s1 or not s2:
+        return 0
+    
+    a = _code_points(s1)
+    b = _code_points(s2)
+    
+    prev = np.zeros(len(b) + 1, dtype=np.int32)
+    curr = np.zeros_like(prev)
+    
+    for ch in a:
+        diag = np.where(b == ch, prev[:-1] + 1, 0)
+        np.maximum.accumulate(np.maximum(prev[1:], diag), out=curr[1:])
+        prev, curr = curr, prev
+    
+    return int(prev[-1])
+
+
+# Stack frames kept free for callers when checking knapsack_memo's depth
+_RECURSION_HEADROOM = 50
+
+
 def knapsack(weights: List[int], values: List[int], capacity: int) -> int:
     """
     0/1 Knapsack problem using dynamic programming.
     
+    Uses a single 1-D DP row, iterating capacities from high to low so
+    each item is counted at most once. For int weights and values whose
+    totals fit in int64, the DP runs as a compiled loop with Numba or as
+    one vector op per item with only NumPy; other input (floats, huge
+    ints) uses Python numbers. Items of weight 0 always fit, even at
+    capacity 0. Negative weights raise ValueError.
+    
     Time Complexity: O(n * capacity)
-    Space Complexity: O(n * capacity)
+    Space Complexity: O(capacity)
     
     Args:
         weights: List of item weights
@@ -273,31 +701,145 @@ def knapsack(weights: List[int], values: List[int], capacity: int) -> int:
     Returns:
         Maximum value achievable
     """
-    n = len(weights)
+    if weights and min(weights) < 0:
+        raise ValueError("knapsack weights must be non-negative")
     
-    # Create DP table
-    dp = [[0] * (capacity + 1) for _ in range(n + 1)]
+    if np is not None and capacity >= 0 and _knapsack_fits_int64(weights, values):
+        weights_np = np.asarray(weights, dtype=np.int64)
+        values_np = np.asarray(values, dtype=np.int64)
+        if njit is not None:
+            return int(_knapsack_nb(weights_np, values_np, capacity))
+        return _knapsack_numpy(weights_np, values_np, capacity)
     
-    # Fill table
-    for i in range(1, n + 1):
-        for w in range(1, capacity + 1):
-            # Don't include item i
-            dp[i][w] = dp[i - 1][w]
-            
-            # Include item i if it fits
-            if weights[i - 1] <= w:
-                dp[i][w] = max(
-                    dp[i][w],
-                    dp[i - 1][w - weights[i - 1]] + values[i - 1]
-                )
+    dp = [0] * (capacity + 1)
+    
+    for wi, vi in zip(weights, values):
+        # Go high to low so dp[w - wi] still excludes the current item
+        for w in range(capacity, wi - 1, -1):
+            if dp[w - wi] + vi > dp[w]:
+                dp[w] = dp[w - wi] + vi
     
-    return dp[n][capacity]
+    return dp[capacity]
+
+
+def _knapsack_fits_int64(weights: List[Any], values: List[Any]) -> bool:
+    """
+    True if the int64 knapsack kernels give the exact Python-int answer.
+    
+    Every weight and value must be an int, and the largest weight must fit
+    in int64 (knapsack has already rejected negative weights). No DP cell
+    can exceed the sum of the absolute values, so that sum must fit in
+    int64 too.
+    """
+    if not all(type(x) is int for x in weights):
+        return False
+    if not all(type(x) is int for x in values):
+        return False
+    if weights and max(weights) > _INT64_MAX:
+        return False
+    return sum(map(abs, values)) <= _INT64_MAX
+
+
+def knapsack_memo(weights: List[int], values: List[int], capacity: int) -> int:
+    """
+    0/1 Knapsack problem using memoized recursion.
+    
+    Only (item, remaining capacity) states reachable from the full
+    capacity are explored, so this beats the dense knapsack table when
+    weights are large relative to the number of items (e.g. 20 items and
+    a capacity of 1e6). The cache is cleared before returning.
+    
+    The recursion goes one level deeper per item, and each level costs
+    two frames of the interpreter's recursion limit (the function plus
+    its lru_cache wrapper). With the default limit of 1000 that allows
+    roughly 475 items; longer inputs raise ValueError instead of a
+    RecursionError partway through.
+    
+    Like knapsack, items of weight 0 always fit, even at capacity 0.
+    
+    Time Complexity: O(number of reachable states), at most O(n * capacity)
+    Space Complexity: O(number of reachable states)
+    
+    Args:
+        weights: List of item weights
+        values: List of item values
+        capacity: Maximum weight capacity
+    
+    Returns:
+        Maximum value achievable
+    """
+    n = len(weights)
+    if 2 * n > sys.getrecursionlimit() - _RECURSION_HEADROOM:
+        raise ValueError(
+            f"knapsack_memo recurses once per item; {n} items exceed the "
+            f"recursion limit, use knapsack instead"
+        )
+    
+    @lru_cache(maxsize=None)
+    def best(i: int, remaining: int) -> int:
+        if i == n:
+            return 0
+        
+        # Skip item i
+        result = best(i + 1, remaining)
+        
+        # Take item i if it fits
+        if weights[i] <= remaining:
+            result = max(result, best(i + 1, remaining - weights[i]) + values[i])
+        
+        return result
+    
+    try:
+        return best(0, capacity)
+    finally:
+        best.cache_clear()
+
+
+def _knapsack_numpy(weights: "np.ndarray", values: "np.ndarray", capacity: int) -> int:
+    """0/1 knapsack with one whole-row NumPy update per item."""
+    dp = np.zeros(capacity + 1, dtype=np.int64)
+    
+    for wi, vi in zip(weights.tolist(), values.tolist()):
+        if wi > capacity:
+            continue
+        # The right-hand side is evaluated before assignment, so every
+        # dp[w - wi] read is from the previous item's row
+        dp[wi:] = np.maximum(dp[wi:], dp[:capacity + 1 - wi] + vi)
+    
+    return int(dp[capacity])
+
+
+def _knapsack_nb(weights: "np.ndarray", values: "np.ndarray", capacity: int) -> int:
+    """0/1 knapsack over int64 arrays using two rolling rows."""
+    prev = np.zeros(capacity + 1, dtype=np.int64)
+    curr = np.zeros(capacity + 1, dtype=np.int64)
+    
+    for i in range(weights.shape[0]):
+        wi = weights[i]
+        vi = values[i]
+        for w in range(capacity + 1):
+            best = prev[w]
+            if wi <= w and prev[w - wi] + vi > best:
+                best = prev[w - wi] + vi
+            curr[w] = best
+        prev, curr = curr, prev
+    
+    return prev[capacity]
+
+
+if njit is not None:
+    _lcs_nb = njit(cache=True)(_lcs_nb)
+    _knapsack_nb = njit(cache=True)(_knapsack_nb)
 
 
 # ============================================================================
 # STRING ALGORITHMS
 # ============================================================================
 
+# ASCII bytes that is_palindrome ignores
+_ASCII_NON_ALNUM = bytes(c for c in range(128) if not chr(c).isalnum())
+
+
 def is_palindrome(s: str) -> bool:
     """
     Check if string is a palindrome (ignoring spaces and case).
@@ -311,6 +853,11 @@ def is_palindrome(s: str) -> bool:
     Returns:
         True if palindrome, False otherwise
     """
+    # ASCII fast path: lowercase and delete non-alphanumerics in C
+    if s.isascii():
+        cleaned = s.encode('ascii').lower().translate(None, _ASCII_NON_ALNUM)
+        return cleaned == cleaned[::-1]
+    
     # Normalize: lowercase and remove non-alphanumeric
     cleaned = ''.join(c.lower() for c in s if c.isalnum())
     
@@ -320,9 +867,12 @@ def is_palindrome(s: str) -> bool:
 
 def find_pattern(text: str, pattern: str) -> List[int]:
     """
-    Find all occurrences of pattern in text (naive string matching).
+    Find all occurrences of pattern in text (overlapping matches included).
     
-    Time Complexity: O(n * m)
+    Each match is located with str.find, so the scan runs in CPython's C
+    string search rather than a Python loop over slices.
+    
+    Time Complexity: O(n * m) worst case, close to O(n) in practice
     Space Complexity: O(k) where k is number of matches
     
     Args:
@@ -333,22 +883,94 @@ def find_pattern(text: str, pattern: str) -> List[int]:
         List of starting indices where pattern is found
     """
     matches = []
-    n, m = len(text), len(pattern)
+    pos = text.find(pattern)
+    
+    while pos != -1:
+        matches.append(pos)
+        pos = text.find(pattern, pos + 1)
+    
+    return matches
+
+
+def find_pattern_kmp(text: str, pattern: str) -> List[int]:
+    """
+    Find all occurrences of pattern in text using Knuth-Morris-Pratt.
+    
+    Unlike a naive scan, KMP never re-examines text characters, so the
+    bound stays linear even for pathological inputs such as "AAAAAB" in
+    a long run of "A". With Numba available the search is compiled.
+    
+    Time Complexity: O(n + m)
+    Space Complexity: O(m + k) where k is number of matches
+    
+    Args:
+        text: Text to search in
+        pattern: Pattern to search for
+    
+    Returns:
+        List of starting indices where pattern is found
+    """
+    if not pattern:
+        return list(range(len(text) + 1))
+    if len(pattern) > len(text):
+        return []
+    
+    if njit is not None:
+        return _kmp_search(_code_points(text), _code_points(pattern))
+    return _kmp_search(text, pattern)
+
+
+def _kmp_failure(pattern) -> List[int]:
+    """fail[i] is the length of the longest proper border of pattern[:i + 1]."""
+    m = len(pattern)
+    fail = [0] * m
+    k = 0
+    
+    for i in range(1, m):
+        while k > 0 and pattern[i] != pattern[k]:
+            k = fail[k - 1]
+        if pattern[i] == pattern[k]:
+            k += 1
+        fail[i] = k
+    
+    return fail
+
+
+def _kmp_search(text, pattern) -> List[int]:
+    """KMP scan over any indexable sequences (str or code-point arrays)."""
+    fail = _kmp_failure(pattern)
+    m = len(pattern)
+    matches = []
+    j = 0
     
-    for i in range(n - m + 1):
-        # Check if pattern matches at position i
-        if text[i:i + m] == pattern:
-            matches.append(i)
+    for i in range(len(text)):
+        while j > 0 and text[i] != pattern[j]:
+            j = fail[j - 1]
+        if text[i] == pattern[j]:
+            j += 1
+        if j == m:
+            matches.append(i - m + 1)
+            j = fail[j - 1]
     
     return matches
 
 
+if njit is not None:
+    _kmp_failure = njit(cache=True)(_kmp_failure)
+    _kmp_search = njit(cache=True)(_kmp_search)
+
+
 def longest_palindromic_substring(s: str) -> str:
     """
-    Find the longest palindromic substring.
+    Find the longest palindromic substring using Manacher's algorithm.
     
-    Time Complexity: O(n²)
-    Space Complexity: O(1)
+    Palindromic radii are computed for every center of the string with
+    separators inserted between characters, reusing the mirror radius
+    inside the rightmost palindrome found so far. With Numba available
+    the scan is compiled.
+    
+    Time Complexity: O(n)
+    Space Complexity: O(n)
     
     Args:
         s: Input string
@@ -359,28 +981,44 @@ def longest_palindromic_substring(s: str) -> str:
     if not s:
         return ""
     
-    def expand_around_center(left: int, right: int) -> int:
-        """Expand around center to find palindrome length."""
-        while left >= 0 and right < len(s) and s[left] == s[right]:
-            left -= 1
-            right += 1
-        return right - left - 1
-    
-    start = end = 0
-    
-    for i in range(len(s)):
-        # Check odd-length palindromes (single center)
-        len1 = expand_around_center(i, i)
-        # Check even-length palindromes (double center)
-        len2 = expand_around_center(i, i + 1)
-        
-        max_len = max(len1, len2)
-        
-        if max_len > end - start:
-            start = i - (max_len - 1) // 2
-            end = i + max_len // 2
-    
-    return s[start:end + 1]
+    # Code points with -1 separators and distinct sentinels at both ends,
+    # so no character of s can be mistaken for a separator
+    if njit is not None:
+        t = np.full(2 * len(s) + 3, -1, dtype=np.int64)
+        t[2:-1:2] = _code_points(s)
+    else:
+        t = [-1] * (2 * len(s) + 3)
+        t[2:-1:2] = map(ord, s)
+    t[0], t[-1] = -2, -3
+    
+    center, radius = _manacher(t)
+    start = (center - radius) // 2
+    return s[start:start + radius]
+
+
+def _manacher(t) -> Tuple[int, int]:
+    """Return (center, radius) of the longest palindrome in transformed t."""
+    m = len(t)
+    p = [0] * m
+    c = r = 0
+    best_c = best_len = 0
+    
+    for i in range(1, m - 1):
+        # Start from the mirrored radius when inside the current palindrome
+        if i < r:
+            p[i] = min(r - i, p[2 * c - i])
+        while t[i + p[i] + 1] == t[i - p[i] - 1]:
+            p[i] += 1
+        if i + p[i] > r:
+            c, r = i, i + p[i]
+        if p[i] >= best_len:  # Ties go to the later center
+            best_c, best_len = i, p[i]
+    
+    return best_c, best_len
+
+
+if njit is not None:
+    _manacher = njit(cache=True)(_manacher)
 
 
 # ============================================================================
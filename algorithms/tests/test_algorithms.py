@@ -11,11 +11,16 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from algorithms import (
-    quick_sort, merge_sort, heap_sort,
+    quick_sort, merge_sort, merge_sort_parallel, heap_sort, comb_sort,
     binary_search, linear_search,
-    fibonacci, longest_common_subsequence, knapsack,
-    is_palindrome, find_pattern, longest_palindromic_substring
+    fibonacci, longest_common_subsequence, knapsack, knapsack_memo,
+    is_palindrome, find_pattern, find_pattern_kmp, longest_palindromic_substring
 )
 
 
@@ -32,16 +37,68 @@ class TestSortingAlgorithms(unittest.TestCase):
         result = quick_sort(self.unsorted)
         self.assertEqual(result, self.sorted_arr)
     
+    def test_quick_sort_other_types(self):
+        """Test quick sort on strings and floats."""
+        self.assertEqual(quick_sort(["pear", "apple", "fig"]), ["apple", "fig", "pear"])
+        self.assertEqual(quick_sort([2.5, -1.0, 2.5, 0.0]), [-1.0, 0.0, 2.5, 2.5])
+    
+    def test_quick_sort_large_presorted(self):
+        """Test quick sort on long already-sorted and duplicate-heavy input."""
+        words = [f"{i:05d}" for i in range(5000)]
+        self.assertEqual(quick_sort(words), words)
+        self.assertEqual(quick_sort(words[::-1]), words)
+        self.assertEqual(quick_sort(["b", "a"] * 500), ["a"] * 500 + ["b"] * 500)
+    
     def test_merge_sort(self):
         """Test merge sort."""
         result = merge_sort(self.unsorted)
         self.assertEqual(result, self.sorted_arr)
     
+    def test_merge_sort_other_types(self):
+        """Test merge sort on strings and floats."""
+        self.assertEqual(merge_sort(["pear", "apple", "fig", "apple"]),
+                         ["apple", "apple", "fig", "pear"])
+        self.assertEqual(merge_sort([0.5, -3.25, 0.5, 2.0]), [-3.25, 0.5, 0.5, 2.0])
+    
+    def test_merge_sort_parallel(self):
+        """Test parallel merge sort on small (serial) and large input."""
+        self.assertEqual(merge_sort_parallel(self.unsorted), self.sorted_arr)
+        large = [(i * 7919) % 60000 for i in range(60000)]
+        self.assertEqual(merge_sort_parallel(large, workers=3), sorted(large))
+        words = [f"{(i * 7919) % 30000:05d}" for i in range(30000)]
+        self.assertEqual(merge_sort_parallel(words, workers=3), sorted(words))
+        pairs = [(i % 7, -i) for i in range(30000)]
+        self.assertEqual(merge_sort_parallel(pairs, workers=2), sorted(pairs))
+    
     def test_heap_sort(self):
         """Test heap sort."""
         result = heap_sort(self.unsorted)
         self.assertEqual(result, self.sorted_arr)
     
+    def test_heap_sort_other_types(self):
+        """Test heap sort on strings, bools and ints beyond 64 bits."""
+        self.assertEqual(heap_sort(["pear", "apple", "fig"]), ["apple", "fig", "pear"])
+        self.assertEqual(heap_sort([2 ** 70, -1, 3]), [-1, 3, 2 ** 70])
+        self.assertEqual([type(x) for x in heap_sort([True, False])], [bool, bool])
+    
+    def test_comb_sort(self):
+        """Test comb sort."""
+        self.assertEqual(comb_sort(self.unsorted), self.sorted_arr)
+        self.assertEqual(comb_sort([]), [])
+        self.assertEqual(comb_sort(["pear", "apple", "fig"]), ["apple", "fig", "pear"])
+        large = [(i * 7919) % 1000 for i in range(1000)]
+        self.assertEqual(comb_sort(large), sorted(large))
+    
+    def test_mixed_and_big_numbers(self):
+        """Test sorts keep ints beyond int64 and int/float mixes exact."""
+        big = [2 ** 63 + 1, 1]
+        mixed = [2 ** 60 + 1, 0.5, 3]
+        for sort in (quick_sort, merge_sort, comb_sort):
+            self.assertEqual(sort(big), [1, 2 ** 63 + 1])
+            result = sort(mixed)
+            self.assertEqual(result, [0.5, 3, 2 ** 60 + 1])
+            self.assertEqual([type(x) for x in result], [float, int, int])
+    
     def test_empty_array(self):
         """Test sorting empty array."""
         self.assertEqual(quick_sort([]), [])
@@ -83,6 +140,13 @@ class TestSearchingAlgorithms(unittest.TestCase):
         """Test linear search when element doesn't exist."""
         self.assertEqual(linear_search(self.unsorted, 10), -1)
 
+    @unittest.skipIf(np is None, "NumPy not installed")
+    def test_linear_search_numpy(self):
+        """Test linear search on a NumPy array."""
+        arr = np.array([5, 2, 8, 1, 9, 8])
+        self.assertEqual(linear_search(arr, 8), 2)
+        self.assertEqual(linear_search(arr, 10), -1)
+
 
 class TestDynamicProgramming(unittest.TestCase):
     """Test cases for dynamic programming algorithms."""
@@ -93,6 +157,7 @@ class TestDynamicProgramming(unittest.TestCase):
         self.assertEqual(fibonacci(1), 1)
         self.assertEqual(fibonacci(5), 5)
         self.assertEqual(fibonacci(10), 55)
+        self.assertEqual(fibonacci(100), 354224848179261915075)
     
     def test_lcs(self):
         """Test longest common subsequence."""
@@ -100,6 +165,9 @@ class TestDynamicProgramming(unittest.TestCase):
         self.assertEqual(longest_common_subsequence("AGGTAB", "GXTXAYB"), 4)
         self.assertEqual(longest_common_subsequence("", "ABC"), 0)
         self.assertEqual(longest_common_subsequence("ABC", ""), 0)
+        self.assertEqual(longest_common_subsequence("café", "caféé"), 4)
+        self.assertEqual(longest_common_subsequence("AB" * 150, "BA" * 150), 299)
+        self.assertEqual(longest_common_subsequence("a\ud800b", "ab"), 2)
     
     def test_knapsack(self):
         """Test 0/1 knapsack problem."""
@@ -113,6 +181,55 @@ class TestDynamicProgramming(unittest.TestCase):
         capacity = 5
         self.assertEqual(knapsack(weights, values, capacity), 220)
 
+    def test_knapsack_exact_values(self):
+        """Test knapsack keeps float values and sums beyond int64 exact."""
+        self.assertEqual(knapsack([1, 2], [1.5, 2.5], 3), 4.0)
+        self.assertEqual(knapsack([1, 1], [2 ** 62, 2 ** 62], 2), 2 ** 63)
+        self.assertEqual(knapsack([1, 2], [2 ** 70, 1], 3), 2 ** 70 + 1)
+    
+    def test_knapsack_negative_weight(self):
+        """Test negative weights are rejected rather than overflowing int64."""
+        with self.assertRaises(ValueError):
+            knapsack([-2], [7], 5)
+        with self.assertRaises(ValueError):
+            knapsack([-1, 3], [5, 4], 3)
+    
+    def test_knapsack_memo(self):
+        """Test memoized knapsack, including a large sparse capacity."""
+        self.assertEqual(knapsack_memo([2, 3, 4, 5], [3, 4, 5, 6], 8), 10)
+        self.assertEqual(knapsack_memo([1, 2, 3], [60, 100, 120], 5), 220)
+        self.assertEqual(knapsack_memo([], [], 10), 0)
+        weights = [400_000, 300_000, 500_000, 200_000]
+        values = [40, 35, 60, 10]
+        self.assertEqual(knapsack_memo(weights, values, 1_000_000), 105)
+    
+    def test_knapsack_memo_matches_knapsack(self):
+        """Test both knapsack solvers agree, including zero-weight items."""
+        cases = [
+            ([3, 7, 2, 8, 0, 6], [6, 11, 3, 6, 18, 13], 6),
+            ([0, 0, 1], [4, 5, 6], 0),
+            ([0], [5], 0),
+            ([2, 0, 3, 0], [3, 1, 4, 1], 4),
+        ]
+        # Deterministic pseudo-random cases with small weights and zeros
+        for k in range(40):
+            n = k % 7
+            weights = [(k * 7 + i * 5) % 6 for i in range(n)]
+            values = [(k * 11 + i * 13) % 17 for i in range(n)]
+            cases.append((weights, values, k % 10))
+        
+        for weights, values, capacity in cases:
+            self.assertEqual(knapsack_memo(weights, values, capacity),
+                             knapsack(weights, values, capacity))
+        self.assertEqual(knapsack([3, 7, 2, 8, 0, 6], [6, 11, 3, 6, 18, 13], 6), 31)
+        self.assertEqual(knapsack([0], [5], 0), 5)
+    
+    def test_knapsack_memo_too_many_items(self):
+        """Test knapsack_memo rejects inputs deeper than the recursion limit."""
+        self.assertEqual(knapsack_memo([1] * 400, [1] * 400, 400), 400)
+        with self.assertRaises(ValueError):
+            knapsack_memo([1] * 3000, [1] * 3000, 3000)
+
 
 class TestStringAlgorithms(unittest.TestCase):
     """Test cases for string algorithms."""
@@ -124,6 +241,8 @@ class TestStringAlgorithms(unittest.TestCase):
         self.assertTrue(is_palindrome(""))
         self.assertFalse(is_palindrome("hello"))
         self.assertFalse(is_palindrome("python"))
+        self.assertTrue(is_palindrome("Was it a car or a cat I saw?"))
+        self.assertTrue(is_palindrome("Été, été!"))
     
     def test_find_pattern(self):
         """Test pattern matching."""
@@ -135,12 +254,23 @@ class TestStringAlgorithms(unittest.TestCase):
         self.assertEqual(find_pattern("hello", "ll"), [2])
         self.assertEqual(find_pattern("hello", "xyz"), [])
     
+    def test_find_pattern_kmp(self):
+        """Test KMP pattern matching, including a pathological input."""
+        self.assertEqual(find_pattern_kmp("AABAACAADAABAAABAA", "AABA"), [0, 9, 13])
+        self.assertEqual(find_pattern_kmp("aaaa", "aa"), [0, 1, 2])
+        self.assertEqual(find_pattern_kmp("A" * 1000 + "B", "AAAAAB"), [995])
+        self.assertEqual(find_pattern_kmp("hello", "xyz"), [])
+        self.assertEqual(find_pattern_kmp("a\udc80b\udc80", "\udc80"), [1, 3])
+    
     def test_longest_palindromic_substring(self):
         """Test finding longest palindromic substring."""
         self.assertIn(longest_palindromic_substring("babad"), ["bab", "aba"])
         self.assertEqual(longest_palindromic_substring("cbbd"), "bb")
         self.assertEqual(longest_palindromic_substring("a"), "a")
         self.assertEqual(longest_palindromic_substring(""), "")
+        self.assertEqual(longest_palindromic_substring("x#y#x$"), "x#y#x")
+        self.assertEqual(longest_palindromic_substring("xy" + "a" * 3000 + "b"), "a" * 3000)
+        self.assertEqual(longest_palindromic_substring("x\ud800y\ud800"), "\ud800y\ud800")
 
 
 if __name__ == '__main__':
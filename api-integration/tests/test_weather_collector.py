@@ -0,0 +1,413 @@
+"""
+Unit tests for the weather collector.
+
+Run with: python -m unittest tests.test_weather_collector
+"""
+
+import asyncio
+import csv
+import io
+import json
+import logging
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import unittest
+from contextlib import closing
+from pathlib import Path
+from unittest import mock
+
+import httpx
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import weather_collector
+from weather_collector import WeatherCollector
+
+
+def mock_response(city: str, temp: float = 20.0) -> dict:
+    """Build an OpenWeatherMap-shaped response for city."""
+    return {
+        'name': city,
+        'sys': {'country': 'XX'},
+        'main': {'temp': temp, 'feels_like': temp - 1, 'humidity': 50, 'pressure': 1010},
+        'weather': [{'main': 'Clear', 'description': 'clear sky'}],
+        'wind': {'speed': 3.5}
+    }
+
+
+def sequence_transport(*responses: httpx.Response) -> httpx.MockTransport:
+    """Mock transport replying with responses in order, one per request."""
+    replies = iter(responses)
+    return httpx.MockTransport(lambda request: next(replies))
+
+
+class CollectorTestCase(unittest.TestCase):
+    """Runs each test in a temporary directory with quiet output."""
+    
+    def setUp(self):
+        """Switch to a temp directory and silence logs and reports."""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(tmp.name)
+        self.db_path = Path(tmp.name) / "weather.db"
+        
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        stdout = mock.patch('sys.stdout', new_callable=io.StringIO)
+        stdout.start()
+        self.addCleanup(stdout.stop)
+    
+    def make_collector(self, **kwargs) -> WeatherCollector:
+        """Create a collector on the temp database, closed after the test."""
+        kwargs.setdefault('api_key', 'test-key')
+        collector = WeatherCollector(db_path=self.db_path, **kwargs)
+        collector.MIN_REQUEST_INTERVAL = 0
+        self.addCleanup(collector.close)
+        return collector
+    
+    def count_rows(self) -> int:
+        """Number of rows in the weather table."""
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            return conn.execute("SELECT COUNT(*) FROM weather_data").fetchone()[0]
+
+
+class TestDatabase(CollectorTestCase):
+    """Test cases for schema setup and saving."""
+    
+    def test_initialize_skips_ddl_on_reopen(self):
+        """Test re-running the schema setup on an existing database issues no DDL."""
+        collector = self.make_collector()
+        statements = []
+        collector.conn.set_trace_callback(statements.append)
+        collector._initialize_database()
+        collector.conn.set_trace_callback(None)
+        self.assertFalse([sql for sql in statements if 'CREATE' in sql.upper()])
+    
+    def test_timestamp_index(self):
+        """Test the timestamp index used by exports exists."""
+        collector = self.make_collector()
+        names = {row[0] for row in collector.conn.execute("SELECT name FROM sqlite_master")}
+        self.assertIn('idx_weather_timestamp', names)
+    
+    def test_wal_mode(self):
+        """Test the database is switched to write-ahead logging."""
+        self.make_collector()
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], 'wal')
+    
+    def test_save_many_dicts_and_tuples(self):
+        """Test save_many accepts parsed dicts and parse_many tuples."""
+        collector = self.make_collector()
+        parsed = collector.parse_weather_data(mock_response('Paris'))
+        self.assertTrue(collector.save_many([parsed, parsed]))
+        self.assertTrue(collector.save_many(collector.parse_many([mock_response('Rome')])))
+        self.assertTrue(collector.save_to_database(parsed))
+        self.assertTrue(collector.save_many([]))
+        self.assertEqual(self.count_rows(), 4)
+    
+    def test_save_to_database_uses_save_many(self):
+        """Test single-row saves go through the batch insert."""
+        collector = self.make_collector()
+        parsed = collector.parse_weather_data(mock_response('Vienna'))
+        with mock.patch.object(collector, 'save_many', return_value=True) as save_many:
+            self.assertTrue(collector.save_to_database(parsed))
+        save_many.assert_called_once_with([parsed])
+    
+    def test_data_persists_across_collectors(self):
+        """Test a second collector reopens the same database."""
+        first = self.make_collector()
+        first.save_to_database(first.parse_weather_data(mock_response('Oslo')))
+        first.close()
+        self.make_collector()
+        self.assertEqual(self.count_rows(), 1)
+    
+    def test_context_manager_closes_connection(self):
+        """Test leaving the with block closes the shared connection."""
+        with self.make_collector() as collector:
+            collector.save_to_database(collector.parse_weather_data(mock_response('Oslo')))
+        with self.assertRaises(sqlite3.ProgrammingError):
+            collector.conn.execute("SELECT 1")
+
+
+class TestParsing(CollectorTestCase):
+    """Test cases for response parsing and display."""
+    
+    def test_parse_weather_data(self):
+        """Test parsing a full response and rejecting absent fields."""
+        collector = self.make_collector()
+        parsed = collector.parse_weather_data(mock_response('Lima', 18.5))
+        self.assertEqual(parsed['city'], 'Lima')
+        self.assertEqual(parsed['temperature'], 18.5)
+        self.assertEqual(parsed['weather_description'], 'clear sky')
+        
+        raw = mock_response('Lima')
+        del raw['wind']['speed']
+        self.assertIsNone(collector.parse_weather_data(raw))
+        self.assertIsNone(collector.parse_weather_data({'name': 'Lima', 'weather': []}))
+    
+    def test_parse_keeps_null_fields(self):
+        """Test a present-but-null field is kept rather than rejected."""
+        collector = self.make_collector()
+        raw = mock_response('Quito')
+        raw['sys']['country'] = None
+        self.assertIsNone(collector.parse_weather_data(raw)['country'])
+        self.assertEqual(collector.parse_many([raw])[0][1], None)
+    
+    def test_parse_many(self):
+        """Test parse_many matches parse_weather_data and skips bad records."""
+        collector = self.make_collector()
+        good = mock_response('Cairo')
+        expected = collector._GET_COLS(collector.parse_weather_data(good))
+        self.assertEqual(collector.parse_many([good]), [expected])
+        
+        bad = [{'name': 'x'}, {**good, 'sys': None}, {**good, 'main': None}, {**good, 'weather': []}]
+        for record in bad:
+            self.assertEqual(collector.parse_many([good, record]), [expected])
+    
+    def test_generate_mock_batch(self):
+        """Test bulk mock data parses like single mock responses."""
+        collector = self.make_collector(demo_mode=True)
+        rows = collector.parse_many(collector.generate_mock_batch(['A', 'B', 'C']))
+        self.assertEqual([row[0] for row in rows], ['A', 'B', 'C'])
+        for row in rows:
+            self.assertTrue(10 <= row[2] <= 30)
+            self.assertTrue(40 <= row[4] <= 90)
+    
+    def test_display_weather_prints_once(self):
+        """Test the weather report is written with a single print call."""
+        collector = self.make_collector()
+        parsed = collector.parse_weather_data(mock_response('Seoul'))
+        with mock.patch('builtins.print') as print_:
+            collector._display_weather(parsed)
+        print_.assert_called_once()
+        self.assertIn('Seoul', print_.call_args[0][0])
+
+
+class TestFetching(CollectorTestCase):
+    """Test cases for HTTP fetching, retries and rate limiting."""
+    
+    def collector_with(self, *responses: httpx.Response) -> WeatherCollector:
+        """Collector whose sync client replies with responses in order."""
+        return self.make_collector(transport=sequence_transport(*responses))
+    
+    def fetch_async(self, collector: WeatherCollector, transport: httpx.MockTransport, city: str):
+        """Run fetch_weather_async for city on a client using transport."""
+        async def fetch():
+            async with httpx.AsyncClient(transport=transport) as client:
+                return await collector.fetch_weather_async(client, city)
+        
+        return asyncio.run(fetch())
+    
+    def test_fetch_weather(self):
+        """Test a successful sync fetch."""
+        collector = self.collector_with(httpx.Response(200, json=mock_response('Tokyo')))
+        self.assertEqual(collector.fetch_weather('Tokyo')['name'], 'Tokyo')
+    
+    def test_retry_after_on_429(self):
+        """Test 429 responses are retried after the Retry-After delay."""
+        collector = self.collector_with(
+            httpx.Response(429, headers={'Retry-After': '7'}),
+            httpx.Response(200, json=mock_response('Tokyo'))
+        )
+        with mock.patch.object(weather_collector.time, 'sleep') as sleep:
+            self.assertEqual(collector.fetch_weather('Tokyo')['name'], 'Tokyo')
+        sleep.assert_called_once_with(7.0)
+    
+    def test_429_holds_back_other_requests(self):
+        """Test a 429 cooldown also delays the next throttled request."""
+        collector = self.collector_with(httpx.Response(429, headers={'Retry-After': '7'}))
+        with mock.patch.object(weather_collector.time, 'sleep') as sleep:
+            self.assertIsNone(collector.fetch_weather('Tokyo', max_retries=1))
+            sleep.assert_not_called()
+            collector._throttle()
+        self.assertAlmostEqual(sleep.call_args[0][0], 7.0, delta=0.5)
+    
+    def test_permanent_errors_not_retried(self):
+        """Test 404/401 and malformed bodies give up without retrying."""
+        for response in (httpx.Response(404), httpx.Response(401), httpx.Response(200, content=b'<html>')):
+            collector = self.collector_with(response)
+            with mock.patch.object(weather_collector.time, 'sleep') as sleep:
+                self.assertIsNone(collector.fetch_weather('Nowhere'))
+            sleep.assert_not_called()
+    
+    def test_retries_exhausted(self):
+        """Test server errors are retried max_retries times, then give up."""
+        collector = self.collector_with(*[httpx.Response(503)] * 3)
+        with mock.patch.object(weather_collector.time, 'sleep') as sleep:
+            self.assertIsNone(collector.fetch_weather('Tokyo', max_retries=3))
+        self.assertEqual(sleep.call_count, 2)
+    
+    def test_retry_delay(self):
+        """Test backoff doubles per attempt and honors Retry-After."""
+        base, jitter = WeatherCollector.RETRY_BACKOFF_BASE, WeatherCollector.RETRY_JITTER
+        for attempt in range(3):
+            delay = WeatherCollector._retry_delay(attempt)
+            self.assertTrue(base * 2 ** attempt <= delay <= base * 2 ** attempt + jitter)
+        self.assertEqual(WeatherCollector._retry_delay(0, '2'), 2.0)
+        self.assertEqual(WeatherCollector._retry_delay(0, '86400'), WeatherCollector.MAX_RETRY_AFTER)
+        self.assertLess(WeatherCollector._retry_delay(0, 'Wed, 21 Oct 2015 07:28:00 GMT'), 1)
+    
+    def test_throttle_spacing(self):
+        """Test the sync throttle spaces request starts apart."""
+        collector = self.make_collector()
+        collector.MIN_REQUEST_INTERVAL = 0.05
+        start = time.monotonic()
+        for _ in range(3):
+            collector._throttle()
+        self.assertGreaterEqual(time.monotonic() - start, 0.1)
+    
+    def test_demo_mode_skips_latency(self):
+        """Test demo batches only sleep when simulate_latency is set."""
+        collector = self.make_collector(demo_mode=True)
+        start = time.monotonic()
+        self.assertEqual(len(collector.collect_weather_batch(['A', 'B', 'C'])), 3)
+        self.assertLess(time.monotonic() - start, 0.5)
+    
+    def test_load_json_fallback(self):
+        """Test response decoding gives the same result without orjson."""
+        body = b'{"name": "Z\\u00fcrich", "main": {"temp": 9.25}}'
+        expected = {'name': 'Zürich', 'main': {'temp': 9.25}}
+        self.assertEqual(weather_collector._load_json(body), expected)
+        with mock.patch.object(weather_collector, 'orjson', None):
+            self.assertEqual(weather_collector._load_json(body), expected)
+    
+    def test_async_fetch(self):
+        """Test an async fetch returns the body, and a 404 gives None."""
+        collector = self.make_collector()
+        transport = sequence_transport(httpx.Response(200, json=mock_response('Tokyo')))
+        self.assertEqual(self.fetch_async(collector, transport, 'Tokyo')['name'], 'Tokyo')
+        self.assertIsNone(self.fetch_async(collector, sequence_transport(httpx.Response(404)), 'Nowhere'))
+    
+    def test_async_retry_after_on_429(self):
+        """Test the async path retries a 429 and then succeeds."""
+        collector = self.make_collector()
+        transport = sequence_transport(
+            httpx.Response(429, headers={'Retry-After': '0'}),
+            httpx.Response(200, json=mock_response('Tokyo'))
+        )
+        self.assertEqual(self.fetch_async(collector, transport, 'Tokyo')['name'], 'Tokyo')
+    
+    def test_async_malformed_body(self):
+        """Test an undecodable async response gives None without retrying."""
+        collector = self.make_collector()
+        transport = sequence_transport(httpx.Response(200, content=b'<html>'))
+        self.assertIsNone(self.fetch_async(collector, transport, 'Nowhere'))
+
+
+class TestAsyncPipeline(CollectorTestCase):
+    """Test cases for the async fetch/parse/save pipeline."""
+    
+    def test_order_kept_and_batches_flushed(self):
+        """Test results keep input order and rows are saved in full batches."""
+        cities = [f"City{i}" for i in range(70)]
+        
+        async def handler(request):
+            # Later cities answer first, so completion order is reversed
+            index = int(request.url.params['q'][4:])
+            await asyncio.sleep((70 - index) * 0.0005)
+            return httpx.Response(200, json=mock_response(f"City{index}"))
+        
+        collector = self.make_collector(transport=httpx.MockTransport(handler))
+        batch_sizes = []
+        save_many = collector.save_many
+        
+        def record_batch(rows):
+            batch_sizes.append(len(rows))
+            return save_many(rows)
+        
+        collector.save_many = record_batch
+        results = asyncio.run(collector.collect_weather_batch_async(cities))
+        
+        self.assertEqual([row['city'] for row in results], cities)
+        self.assertEqual(batch_sizes, [32, 32, 6])
+        self.assertEqual(self.count_rows(), 70)
+    
+    def test_failed_fetches_skipped(self):
+        """Test cities that fail to fetch are left out of the results."""
+        def handler(request):
+            city = request.url.params['q']
+            if city == 'Atlantis':
+                return httpx.Response(404)
+            return httpx.Response(200, json=mock_response(city))
+        
+        collector = self.make_collector(transport=httpx.MockTransport(handler))
+        results = asyncio.run(collector.collect_weather_batch_async(['Rome', ' Atlantis', 'Oslo']))
+        self.assertEqual([row['city'] for row in results], ['Rome', 'Oslo'])
+        self.assertEqual(self.count_rows(), 2)
+    
+    def test_writer_failure_cancels_fetches(self):
+        """Test an error while saving is raised instead of hanging the batch."""
+        collector = self.make_collector(demo_mode=True)
+        collector.save_many = mock.Mock(side_effect=RuntimeError("disk on fire"))
+        
+        async def collect():
+            cities = [f"City{i}" for i in range(200)]
+            return await asyncio.wait_for(collector.collect_weather_batch_async(cities), timeout=5)
+        
+        with self.assertRaises(RuntimeError):
+            asyncio.run(collect())
+
+
+class TestExport(CollectorTestCase):
+    """Test cases for exporting stored data."""
+    
+    def setUp(self):
+        """Store a few known rows to export."""
+        super().setUp()
+        self.collector = self.make_collector()
+        self.collector.save_many([
+            self.collector.parse_weather_data(mock_response(city, temp))
+            for city, temp in (('Berlin', 11.5), ('Madrid', 24.0), ('Zürich', 9.25))
+        ])
+    
+    def test_export_json(self):
+        """Test JSON export writes every row as a parseable record."""
+        self.collector.export_data(format='json')
+        with open('weather_export.json', encoding='utf-8') as f:
+            records = json.load(f)
+        self.assertEqual({r['city']: r['temperature'] for r in records},
+                         {'Berlin': 11.5, 'Madrid': 24.0, 'Zürich': 9.25})
+        self.assertEqual(set(records[0]), {
+            'city', 'country', 'temperature', 'feels_like', 'humidity', 'pressure',
+            'weather_condition', 'weather_description', 'wind_speed', 'timestamp'
+        })
+    
+    def test_export_json_empty(self):
+        """Test JSON export of an empty table is an empty list."""
+        self.collector.conn.execute("DELETE FROM weather_data")
+        self.collector.conn.commit()
+        self.collector.export_data(format='json')
+        with open('weather_export.json', encoding='utf-8') as f:
+            self.assertEqual(json.load(f), [])
+    
+    def test_export_csv(self):
+        """Test CSV export writes a header and one line per row."""
+        self.collector.export_data(format='csv')
+        with open('weather_export.csv', newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(sorted(r['city'] for r in rows), ['Berlin', 'Madrid', 'Zürich'])
+        self.assertEqual({r['wind_speed'] for r in rows}, {'3.5'})
+    
+    def test_export_limit(self):
+        """Test export stops at the requested number of records."""
+        self.collector.export_data(format='csv', limit=2)
+        with open('weather_export.csv', newline='', encoding='utf-8') as f:
+            self.assertEqual(len(list(csv.DictReader(f))), 2)
+    
+    @unittest.skipIf(weather_collector.pa is None, "pyarrow not installed")
+    def test_export_parquet(self):
+        """Test Parquet export round-trips the rows with typed columns."""
+        self.collector.export_data(format='parquet')
+        table = weather_collector.pq.read_table('weather_export.parquet')
+        self.assertEqual(table.num_rows, 3)
+        self.assertEqual(str(table.schema.field('humidity').type), 'int64')
+        self.assertEqual(sorted(table.column('city').to_pylist()), ['Berlin', 'Madrid', 'Zürich'])
+
+
+if __name__ == '__main__':
+    unittest.main()
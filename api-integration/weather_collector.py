@@ -8,18 +8,43 @@ Author: Gert Coetser
 Date: November 2025
 """
 
-import requests
+import httpx
+import asyncio
 import json
 import sqlite3
 import csv
+import textwrap
+import operator
 import time
+import random
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 from pathlib import Path
 import argparse
 import os
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json module is used instead
+    orjson = None
+
+try:
+    import h2  # noqa: F401  (enables httpx HTTP/2 support)
+except ImportError:  # h2 is optional; httpx falls back to HTTP/1.1
+    h2 = None
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; only speeds up bulk mock data
+    np = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional; only needed for Parquet export
+    pa = pq = None
+
 
 # Configure logging
 logging.basicConfig(
@@ -29,31 +54,154 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Default for .get lookups, telling an absent field apart from a JSON null
+_MISSING = object()
+
+
+def _load_json(content: bytes) -> Dict:
+    """Decode a JSON response body (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _dump_record(record: Dict) -> str:
+    """Encode one export record as 2-space indented JSON."""
+    if orjson is not None:
+        return orjson.dumps(record, default=str, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(record, indent=2, default=str)
+
+
 class WeatherCollector:
     """Collects and stores weather data from OpenWeatherMap API."""
     
     BASE_URL = "https://api.openweathermap.org/data/2.5/weather"
+    HEADERS = {'User-Agent': 'WeatherCollector/1.0'}
+    MAX_RETRIES = 3
+    
+    # Shared by the sync and async clients; HTTP/2 needs the h2 package
+    HTTP2 = h2 is not None
+    HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+    
+    # Retry backoff: base delay in seconds (doubled per attempt) and max jitter
+    RETRY_BACKOFF_BASE = 0.25
+    RETRY_JITTER = 0.1
     
-    def __init__(self, api_key: Optional[str] = None, demo_mode: bool = False):
+    # Longest Retry-After honored, in seconds (the free tier's quota window)
+    MAX_RETRY_AFTER = 60.0
+    
+    # Async batch limits: requests in flight, and spacing between request
+    # starts (1s keeps the free tier's 60 requests/minute quota)
+    MAX_CONCURRENT_REQUESTS = 10
+    MIN_REQUEST_INTERVAL = 1.0
+    
+    # Rows the async pipeline's writer commits per transaction
+    WRITE_BATCH_SIZE = 32
+    
+    # Rows fetched per round trip when streaming exports
+    EXPORT_CHUNK_SIZE = 500
+    
+    # Choices for generated demo data
+    MOCK_CONDITIONS = ['Clear', 'Clouds', 'Rain', 'Snow']
+    MOCK_DESCRIPTIONS = ['clear sky', 'few clouds', 'light rain', 'overcast']
+    
+    # Column order shared by the INSERT statement and the row extractor
+    _INSERT_SQL = (
+        "INSERT INTO weather_data "
+        "(city, country, temperature, feels_like, humidity, pressure, "
+        "weather_condition, weather_description, wind_speed) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    )
+    _GET_COLS = operator.itemgetter(
+        'city', 'country', 'temperature', 'feels_like', 'humidity',
+        'pressure', 'weather_condition', 'weather_description', 'wind_speed'
+    )
+    
+    def __init__(self, api_key: Optional[str] = None, demo_mode: bool = False,
+                 simulate_latency: bool = False,
+                 db_path: Union[str, Path] = "weather_data.db",
+                 transport: Optional[Union[httpx.BaseTransport, httpx.AsyncBaseTransport]] = None):
         """
         Initialize the WeatherCollector.
         
         Args:
             api_key: OpenWeatherMap API key
             demo_mode: If True, uses mock data instead of real API
+            simulate_latency: If True, demo mode sleeps 0.5s per request to
+                mimic a network round trip
+            db_path: SQLite database file
+            transport: Test hook. An httpx transport shared by the sync and
+                async clients, so it must implement both BaseTransport and
+                AsyncBaseTransport, as httpx.MockTransport does. Leave it
+                None to talk to the real API
         """
         self.api_key = api_key
         self.demo_mode = demo_mode
-        self.db_path = Path("weather_data.db")
-        self.session = requests.Session()
-        self.session.headers.update({'User-Agent': 'WeatherCollector/1.0'})
+        self.simulate_latency = simulate_latency
+        self.db_path = Path(db_path)
+        self.transport = transport
         
+        # Pooled keep-alive connections; over HTTP/2 concurrent requests
+        # share one multiplexed connection to the API host
+        self.client = httpx.Client(
+            http2=self.HTTP2,
+            headers=self.HEADERS,
+            timeout=10.0,
+            limits=self.HTTP_LIMITS,
+            transport=transport
+        )
+        
+        self._next_request_at = 0.0
+        
+        # One long-lived connection, reused by every database call
+        self.conn = self._connect()
         self._initialize_database()
     
+    def __enter__(self) -> "WeatherCollector":
+        """Support use as a context manager."""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Release resources when leaving the with-block."""
+        self.close()
+    
+    def close(self) -> None:
+        """Close the database connection and HTTP client."""
+        self.conn.close()
+        self.client.close()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open the database connection with write-friendly pragmas applied.
+        
+        synchronous and the cache settings only last for the connection,
+        so they are set once here rather than per query. Statements are
+        cached by their exact SQL text, which is why inserts always go
+        through the one _INSERT_SQL string.
+        """
+        conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                               cached_statements=256)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
+        return conn
+    
     def _initialize_database(self) -> None:
         """Create database and tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.conn as conn:
+            # WAL is stored in the database file, so this sticks across runs
+            conn.execute("PRAGMA journal_mode=WAL")
             cursor = conn.cursor()
+            
+            # Schema already in place: skip the DDL and its commit. The
+            # timestamp index is the newest schema object, so check for it
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master "
+                "WHERE type = 'index' AND name = 'idx_weather_timestamp' LIMIT 1"
+            )
+            if cursor.fetchone():
+                return
+            
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS weather_data (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -69,6 +217,12 @@ class WeatherCollector:
                     timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
                 )
             """)
+            # Lets export_data's ORDER BY timestamp DESC LIMIT n read rows
+            # straight off the index instead of sorting the whole table
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_weather_timestamp
+                ON weather_data (timestamp DESC)
+            """)
             conn.commit()
         logger.info("✓ Database initialized")
     
@@ -82,8 +236,6 @@ class WeatherCollector:
         Returns:
             Mock weather data dictionary
         """
-        import random
-        
         mock_data = {
             'name': city,
             'sys': {'country': 'XX'},
@@ -94,8 +246,8 @@ class WeatherCollector:
                 'pressure': random.randint(1000, 1030)
             },
             'weather': [{
-                'main': random.choice(['Clear', 'Clouds', 'Rain', 'Snow']),
-                'description': random.choice(['clear sky', 'few clouds', 'light rain', 'overcast'])
+                'main': random.choice(self.MOCK_CONDITIONS),
+                'description': random.choice(self.MOCK_DESCRIPTIONS)
             }],
             'wind': {
                 'speed': round(random.uniform(1, 15), 2)
@@ -103,7 +255,47 @@ class WeatherCollector:
         }
         return mock_data
     
-    def fetch_weather(self, city: str, max_retries: int = 3) -> Optional[Dict]:
+    def generate_mock_batch(self, cities: List[str]) -> List[Dict]:
+        """
+        Generate mock weather data for many cities at once.
+        
+        With NumPy installed each field is drawn for the whole batch in
+        one vectorized call instead of one random call per city, which
+        helps when stress-testing with thousands of cities.
+        
+        Args:
+            cities: City names
+            
+        Returns:
+            Mock weather data dictionaries, one per city
+        """
+        if np is None:
+            return [self._generate_mock_data(city) for city in cities]
+        
+        n = len(cities)
+        rng = np.random.default_rng()
+        temps = rng.uniform(10, 30, n).round(2).tolist()
+        feels = rng.uniform(10, 30, n).round(2).tolist()
+        humidity = rng.integers(40, 91, n).tolist()
+        pressure = rng.integers(1000, 1031, n).tolist()
+        conditions = rng.choice(self.MOCK_CONDITIONS, n).tolist()
+        descriptions = rng.choice(self.MOCK_DESCRIPTIONS, n).tolist()
+        wind = rng.uniform(1, 15, n).round(2).tolist()
+        
+        return [
+            {
+                'name': city,
+                'sys': {'country': 'XX'},
+                'main': {'temp': t, 'feels_like': fl, 'humidity': h, 'pressure': p},
+                'weather': [{'main': c, 'description': d}],
+                'wind': {'speed': w}
+            }
+            for city, t, fl, h, p, c, d, w in zip(
+                cities, temps, feels, humidity, pressure, conditions, descriptions, wind
+            )
+        ]
+    
+    def fetch_weather(self, city: str, max_retries: int = MAX_RETRIES) -> Optional[Dict]:
         """
         Fetch weather data for a specific city.
         
@@ -115,8 +307,9 @@ class WeatherCollector:
             Weather data dictionary or None if failed
         """
         if self.demo_mode:
-            logger.info(f"📊 Fetching weather data for {city} (DEMO MODE)")
-            time.sleep(0.5)  # Simulate API delay
+            logger.info("📊 Fetching weather data for %s (DEMO MODE)", city)
+            if self.simulate_latency:
+                time.sleep(0.5)  # Simulate API delay
             return self._generate_mock_data(city)
         
         if not self.api_key:
@@ -131,104 +324,280 @@ class WeatherCollector:
         
         for attempt in range(max_retries):
             try:
-                logger.info(f"📊 Fetching weather data for {city} (attempt {attempt + 1}/{max_retries})")
-                response = self.session.get(
-                    self.BASE_URL, 
-                    params=params, 
-                    timeout=10
-                )
+                logger.info("📊 Fetching weather data for %s (attempt %s/%s)", city, attempt + 1, max_retries)
+                response = self.client.get(self.BASE_URL, params=params)
                 response.raise_for_status()
                 
-                data = response.json()
-                logger.info(f"✓ Successfully fetched data for {city}")
+                data = _load_json(response.content)
+                logger.info("✓ Successfully fetched data for %s", city)
                 return data
-                
-            except requests.exceptions.HTTPError as e:
-                if response.status_code == 404:
-                    logger.error(f"✗ City '{city}' not found")
-                    return None
-                elif response.status_code == 401:
-                    logger.error("✗ Invalid API key")
+            
+            except (httpx.HTTPError, ValueError) as e:
+                wait_time = self._retry_wait(city, e, attempt, max_retries)
+                if wait_time is None:
                     return None
-                elif response.status_code == 429:
-                    logger.warning("⚠ Rate limit exceeded, waiting...")
-                    time.sleep(2 ** attempt)
-                else:
-                    logger.error(f"✗ HTTP error: {e}")
-                    
-            except requests.exceptions.RequestException as e:
-                logger.error(f"✗ Request failed: {e}")
+            
+            # Wait before retry (exponential backoff)
+            time.sleep(wait_time)
+        
+        return None
+    
+    def _retry_wait(self, city: str, error: Exception, attempt: int,
+                    max_retries: int) -> Optional[float]:
+        """
+        Log a failed fetch attempt and decide whether to retry it.
+        
+        Shared by fetch_weather and fetch_weather_async. 404, 401 and
+        undecodable bodies are permanent; 429 honors Retry-After; other
+        HTTP and transport errors back off via _retry_delay. A 429 also
+        pushes the shared request slot past its delay, so every request
+        waits out the cooldown, not just this retry.
+        
+        Args:
+            city: City name
+            error: Exception raised by the attempt
+            attempt: Zero-based attempt number
+            max_retries: Maximum number of retry attempts
+            
+        Returns:
+            Seconds to wait before the next attempt, or None to give up
+        """
+        retry_after = None
+        rate_limited = False
+        
+        if isinstance(error, httpx.HTTPStatusError):
+            status = error.response.status_code
+            if status == 404:
+                logger.error("✗ City '%s' not found", city)
+                return None
+            elif status == 401:
+                logger.error("✗ Invalid API key")
+                return None
+            elif status == 429:
+                logger.warning("⚠ Rate limit exceeded, waiting...")
+                retry_after = error.response.headers.get("Retry-After")
+                rate_limited = True
+            else:
+                logger.error("✗ HTTP error: %s", error)
+        elif isinstance(error, httpx.HTTPError):
+            logger.error("✗ Request failed: %s", error)
+        else:
+            logger.error("✗ Invalid JSON response for %s: %s", city, error)
+            return None
+        
+        wait_time = self._retry_delay(attempt, retry_after)
+        if rate_limited:
+            self._next_request_at = max(self._next_request_at, time.monotonic() + wait_time)
+        
+        if attempt >= max_retries - 1:
+            logger.error("✗ Failed to fetch data for %s after %s attempts", city, max_retries)
+            return None
+        
+        logger.info("Retrying in %.2f seconds...", wait_time)
+        return wait_time
+    
+    @classmethod
+    def _retry_delay(cls, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Seconds to wait before retry number attempt + 1.
+        
+        Honors a numeric Retry-After header when the server sends one,
+        capped at MAX_RETRY_AFTER; otherwise backs off 0.25s, 0.5s, 1s, ...
+        plus up to 0.1s of jitter so concurrent retries don't fire in
+        lockstep.
+        """
+        if retry_after is not None:
+            try:
+                return min(max(0.0, float(retry_after)), cls.MAX_RETRY_AFTER)
+            except ValueError:
+                pass  # HTTP-date form; fall back to backoff
+        return cls.RETRY_BACKOFF_BASE * (2 ** attempt) + random.uniform(0, cls.RETRY_JITTER)
+    
+    def _throttle(self) -> None:
+        """
+        Block until the next request slot, spacing requests apart.
+        
+        Slots are measured from when each request started, so time spent
+        waiting on a slow response already counts toward the interval.
+        """
+        now = time.monotonic()
+        if now < self._next_request_at:
+            time.sleep(self._next_request_at - now)
+        self._next_request_at = max(now, self._next_request_at) + self.MIN_REQUEST_INTERVAL
+    
+    async def _throttle_async(self) -> None:
+        """Wait until the next request slot, spacing requests apart."""
+        now = time.monotonic()
+        slot = max(now, self._next_request_at)
+        # Claim the slot before awaiting so concurrent tasks queue behind it
+        self._next_request_at = slot + self.MIN_REQUEST_INTERVAL
+        if slot > now:
+            await asyncio.sleep(slot - now)
+    
+    async def fetch_weather_async(self, client: httpx.AsyncClient, city: str,
+                                  max_retries: int = MAX_RETRIES) -> Optional[Dict]:
+        """
+        Fetch weather data for a specific city without blocking the event loop.
+        
+        Args:
+            client: Shared async HTTP client
+            city: City name
+            max_retries: Maximum number of retry attempts
+            
+        Returns:
+            Weather data dictionary or None if failed
+        """
+        if self.demo_mode:
+            logger.info("📊 Fetching weather data for %s (DEMO MODE)", city)
+            if self.simulate_latency:
+                await asyncio.sleep(0.5)  # Simulate API delay
+            return self._generate_mock_data(city)
+        
+        if not self.api_key:
+            logger.error("API key is required. Use --demo flag for demo mode.")
+            return None
+        
+        params = {
+            'q': city,
+            'appid': self.api_key,
+            'units': 'metric'
+        }
+        
+        for attempt in range(max_retries):
+            try:
+                await self._throttle_async()
+                logger.info("📊 Fetching weather data for %s (attempt %s/%s)", city, attempt + 1, max_retries)
+                response = await client.get(self.BASE_URL, params=params, timeout=10)
+                response.raise_for_status()
                 
+                data = _load_json(response.content)
+                logger.info("✓ Successfully fetched data for %s", city)
+                return data
+            
+            except (httpx.HTTPError, ValueError) as e:
+                wait_time = self._retry_wait(city, e, attempt, max_retries)
+                if wait_time is None:
+                    return None
+            
             # Wait before retry (exponential backoff)
-            if attempt < max_retries - 1:
-                wait_time = 2 ** attempt
-                logger.info(f"Retrying in {wait_time} seconds...")
-                time.sleep(wait_time)
+            await asyncio.sleep(wait_time)
         
-        logger.error(f"✗ Failed to fetch data for {city} after {max_retries} attempts")
         return None
     
     def parse_weather_data(self, raw_data: Dict) -> Dict:
         """
         Parse raw API response into structured format.
         
+        A field that is present but null is kept as None (stored as NULL);
+        only absent fields, or null/empty 'sys', 'main', 'weather' and
+        'wind' objects, reject the response.
+        
         Args:
             raw_data: Raw API response
             
         Returns:
-            Parsed weather data dictionary
+            Parsed weather data dictionary, or None if a field is missing
+        """
+        main = raw_data.get('main') or {}
+        weather = (raw_data.get('weather') or [{}])[0]
+        wind = raw_data.get('wind') or {}
+        
+        parsed = {
+            'city': raw_data.get('name', _MISSING),
+            'country': (raw_data.get('sys') or {}).get('country', _MISSING),
+            'temperature': main.get('temp', _MISSING),
+            'feels_like': main.get('feels_like', _MISSING),
+            'humidity': main.get('humidity', _MISSING),
+            'pressure': main.get('pressure', _MISSING),
+            'weather_condition': weather.get('main', _MISSING),
+            'weather_description': weather.get('description', _MISSING),
+            'wind_speed': wind.get('speed', _MISSING)
+        }
+        
+        for field, value in parsed.items():
+            if value is _MISSING:
+                logger.error("✗ Error parsing weather data: missing field %s", field)
+                return None
+        
+        return parsed
+    
+    def parse_many(self, raw_list: List[Dict]) -> List[Tuple]:
+        """
+        Parse a batch of raw API responses into insert-ready tuples.
+        
+        Rows come out in _INSERT_SQL column order, so they can be passed
+        straight to save_many without building intermediate dictionaries.
+        
+        Args:
+            raw_list: Raw API responses
+            
+        Returns:
+            List of column tuples; malformed responses are skipped
         """
         try:
-            parsed = {
-                'city': raw_data['name'],
-                'country': raw_data['sys']['country'],
-                'temperature': raw_data['main']['temp'],
-                'feels_like': raw_data['main']['feels_like'],
-                'humidity': raw_data['main']['humidity'],
-                'pressure': raw_data['main']['pressure'],
-                'weather_condition': raw_data['weather'][0]['main'],
-                'weather_description': raw_data['weather'][0]['description'],
-                'wind_speed': raw_data['wind']['speed']
-            }
-            return parsed
-        except KeyError as e:
-            logger.error(f"✗ Error parsing weather data: missing key {e}")
-            return None
+            return [
+                (r['name'], r['sys']['country'], m['temp'], m['feels_like'],
+                 m['humidity'], m['pressure'], w['main'], w['description'],
+                 r['wind']['speed'])
+                for r in raw_list
+                for m in (r['main'],)
+                for w in (r['weather'][0],)
+            ]
+        except (KeyError, IndexError, TypeError):
+            # Fall back to per-record parsing so one bad response does not
+            # drop the whole batch. Both paths keep null fields and reject
+            # absent fields or null/empty sub-objects, so a record parses
+            # the same however its neighbours fare
+            parsed = (self.parse_weather_data(r) for r in raw_list)
+            return [self._GET_COLS(p) for p in parsed if p]
     
     def save_to_database(self, weather_data: Dict) -> bool:
         """
         Save weather data to SQLite database.
         
+        Single-row convenience wrapper around save_many, so every insert
+        goes through the same executemany statement.
+        
         Args:
             weather_data: Parsed weather data
             
         Returns:
             True if successful, False otherwise
         """
+        return self.save_many([weather_data])
+    
+    def save_many(self, rows: List) -> bool:
+        """
+        Save several parsed weather records in a single transaction.
+        
+        All rows are inserted with one executemany call and committed
+        once, so a batch pays for a single disk sync instead of one per
+        city.
+        
+        Args:
+            rows: Parsed weather data dictionaries, or column tuples from
+                parse_many
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if not rows:
+            return True
+        
+        if isinstance(rows[0], tuple):
+            params = rows
+        else:
+            params = list(map(self._GET_COLS, rows))
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.conn as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO weather_data 
-                    (city, country, temperature, feels_like, humidity, pressure,
-                     weather_condition, weather_description, wind_speed)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    weather_data['city'],
-                    weather_data['country'],
-                    weather_data['temperature'],
-                    weather_data['feels_like'],
-                    weather_data['humidity'],
-                    weather_data['pressure'],
-                    weather_data['weather_condition'],
-                    weather_data['weather_description'],
-                    weather_data['wind_speed']
-                ))
+                cursor.executemany(self._INSERT_SQL, params)
                 conn.commit()
-            logger.info(f"✓ Saved data for {weather_data['city']} to database")
+            logger.info("✓ Saved %s records to database", len(params))
             return True
         except sqlite3.Error as e:
-            logger.error(f"✗ Database error: {e}")
+            logger.error("✗ Database error: %s", e)
             return False
     
     def collect_weather_batch(self, cities: List[str]) -> List[Dict]:
@@ -244,23 +613,105 @@ class WeatherCollector:
         results = []
         
         for city in cities:
+            # Rate limiting: only real API calls count against the quota
+            if not self.demo_mode:
+                self._throttle()
+            
             raw_data = self.fetch_weather(city.strip())
             
             if raw_data:
                 parsed_data = self.parse_weather_data(raw_data)
                 
                 if parsed_data:
-                    self.save_to_database(parsed_data)
                     results.append(parsed_data)
                     
                     # Display results
                     self._display_weather(parsed_data)
-            
-            # Rate limiting: wait between requests
-            time.sleep(1)
+        
+        # Persist the whole batch in one transaction
+        self.save_many(results)
         
         return results
     
+    async def collect_weather_batch_async(self, cities: List[str]) -> List[Dict]:
+        """
+        Collect weather data for multiple cities concurrently.
+        
+        Requests share one HTTP client and run concurrently, bounded by
+        MAX_CONCURRENT_REQUESTS and spaced MIN_REQUEST_INTERVAL apart, so
+        network round trips overlap instead of adding up. Parsed rows are
+        queued to a writer task that saves them WRITE_BATCH_SIZE at a time
+        in a worker thread, so database commits overlap with fetching.
+        
+        Args:
+            cities: List of city names
+            
+        Returns:
+            List of parsed weather data dictionaries
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.WRITE_BATCH_SIZE)
+        results: List[Optional[Dict]] = [None] * len(cities)
+        
+        async def fetch(client: httpx.AsyncClient, index: int, city: str) -> None:
+            async with semaphore:
+                raw_data = await self.fetch_weather_async(client, city)
+            
+            if raw_data:
+                parsed_data = self.parse_weather_data(raw_data)
+                
+                if parsed_data:
+                    results[index] = parsed_data
+                    
+                    # Display results
+                    self._display_weather(parsed_data)
+                    await queue.put(parsed_data)
+        
+        async def write() -> None:
+            batch = []
+            while True:
+                row = await queue.get()
+                if row is not None:
+                    batch.append(row)
+                
+                # Flush a full batch, or whatever is left once fetching ends
+                if batch and (row is None or len(batch) >= self.WRITE_BATCH_SIZE):
+                    await asyncio.to_thread(self.save_many, batch)
+                    batch = []
+                
+                if row is None:
+                    return
+        
+        writer = asyncio.create_task(write())
+        
+        async with httpx.AsyncClient(http2=self.HTTP2, headers=self.HEADERS,
+                                     limits=self.HTTP_LIMITS,
+                                     transport=self.transport) as client:
+            fetching = asyncio.gather(
+                *[fetch(client, i, city.strip()) for i, city in enumerate(cities)],
+                return_exceptions=True
+            )
+            await asyncio.wait([fetching, writer], return_when=asyncio.FIRST_COMPLETED)
+            
+            # The writer only stops before the sentinel if saving raised;
+            # cancel the fetches, which would block on the full queue
+            if writer.done():
+                fetching.cancel()
+                await asyncio.gather(fetching, return_exceptions=True)
+                writer.result()
+            
+            outcomes = await fetching
+        
+        # Sentinel: no more rows, flush and stop the writer
+        await queue.put(None)
+        await writer
+        
+        for city, outcome in zip(cities, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error("✗ Unexpected error fetching %s: %s", city.strip(), outcome)
+        
+        return [row for row in results if row is not None]
+    
     def _display_weather(self, data: Dict) -> None:
         """
         Display weather data in a formatted way.
@@ -268,26 +719,29 @@ class WeatherCollector:
         Args:
             data: Parsed weather data
         """
-        print("\n" + "="*50)
-        print(f"🌍 {data['city']}, {data['country']}")
-        print("="*50)
-        print(f"🌡️  Temperature:    {data['temperature']}°C (feels like {data['feels_like']}°C)")
-        print(f"💧 Humidity:       {data['humidity']}%")
-        print(f"📊 Pressure:       {data['pressure']} hPa")
-        print(f"☁️  Condition:      {data['weather_condition']} - {data['weather_description']}")
-        print(f"💨 Wind Speed:     {data['wind_speed']} m/s")
-        print("="*50)
+        rule = "="*50
+        print("\n".join([
+            "\n" + rule,
+            f"🌍 {data['city']}, {data['country']}",
+            rule,
+            f"🌡️  Temperature:    {data['temperature']}°C (feels like {data['feels_like']}°C)",
+            f"💧 Humidity:       {data['humidity']}%",
+            f"📊 Pressure:       {data['pressure']} hPa",
+            f"☁️  Condition:      {data['weather_condition']} - {data['weather_description']}",
+            f"💨 Wind Speed:     {data['wind_speed']} m/s",
+            rule
+        ]))
     
     def export_data(self, format: str = 'json', limit: int = 100) -> None:
         """
         Export weather data from database to file.
         
         Args:
-            format: Export format ('json' or 'csv')
+            format: Export format ('json', 'csv' or 'parquet')
             limit: Maximum number of records to export
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.conn as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     SELECT city, country, temperature, feels_like, humidity, 
@@ -298,40 +752,89 @@ class WeatherCollector:
                     LIMIT ?
                 """, (limit,))
                 
-                rows = cursor.fetchall()
                 columns = [desc[0] for desc in cursor.description]
                 
                 if format == 'json':
-                    data = [dict(zip(columns, row)) for row in rows]
                     output_path = Path("weather_export.json")
+                    count = 0
                     
-                    with open(output_path, 'w') as f:
-                        json.dump(data, f, indent=2, default=str)
+                    # Stream records straight from the cursor, producing the
+                    # same layout as json.dump(records, f, indent=2)
+                    with open(output_path, 'w', encoding='utf-8') as f:
+                        f.write("[")
+                        for row in cursor:
+                            record = _dump_record(dict(zip(columns, row)))
+                            f.write(",\n" if count else "\n")
+                            f.write(textwrap.indent(record, "  "))
+                            count += 1
+                        f.write("\n]" if count else "]")
                     
-                    logger.info(f"✓ Exported {len(data)} records to {output_path}")
+                    logger.info("✓ Exported %s records to %s", count, output_path)
                 
                 elif format == 'csv':
                     output_path = Path("weather_export.csv")
+                    count = 0
                     
                     with open(output_path, 'w', newline='') as f:
                         writer = csv.writer(f)
                         writer.writerow(columns)
-                        writer.writerows(rows)
+                        
+                        # Hold at most EXPORT_CHUNK_SIZE rows in memory at once
+                        while True:
+                            rows = cursor.fetchmany(self.EXPORT_CHUNK_SIZE)
+                            if not rows:
+                                break
+                            writer.writerows(rows)
+                            count += len(rows)
                     
-                    logger.info(f"✓ Exported {len(rows)} records to {output_path}")
+                    logger.info("✓ Exported %s records to %s", count, output_path)
+                
+                elif format == 'parquet':
+                    if pa is None:
+                        logger.error("✗ Parquet export requires pyarrow (pip install pyarrow)")
+                        return
+                    
+                    output_path = Path("weather_export.parquet")
+                    schema = pa.schema([
+                        ('city', pa.string()),
+                        ('country', pa.string()),
+                        ('temperature', pa.float64()),
+                        ('feels_like', pa.float64()),
+                        ('humidity', pa.int64()),
+                        ('pressure', pa.int64()),
+                        ('weather_condition', pa.string()),
+                        ('weather_description', pa.string()),
+                        ('wind_speed', pa.float64()),
+                        ('timestamp', pa.string())
+                    ])
+                    count = 0
+                    
+                    # One columnar row group per fetched chunk
+                    with pq.ParquetWriter(output_path, schema) as writer:
+                        while True:
+                            rows = cursor.fetchmany(self.EXPORT_CHUNK_SIZE)
+                            if not rows:
+                                break
+                            table = pa.table(
+                                [list(col) for col in zip(*rows)], schema=schema
+                            )
+                            writer.write_table(table)
+                            count += len(rows)
+                    
+                    logger.info("✓ Exported %s records to %s", count, output_path)
                 
                 else:
-                    logger.error(f"✗ Unsupported export format: {format}")
+                    logger.error("✗ Unsupported export format: %s", format)
                     
         except sqlite3.Error as e:
-            logger.error(f"✗ Database error during export: {e}")
+            logger.error("✗ Database error during export: %s", e)
 
 
 def main():
     """Main execution function."""
     parser = argparse.ArgumentParser(description='Weather Data Collector')
     parser.add_argument('--cities', type=str, help='Comma-separated list of cities')
-    parser.add_argument('--export', type=str, choices=['json', 'csv'], help='Export data format')
+    parser.add_argument('--export', type=str, choices=['json', 'csv', 'parquet'], help='Export data format')
     parser.add_argument('--demo', action='store_true', help='Run in demo mode (no API key needed)')
     
     args = parser.parse_args()
@@ -345,32 +848,31 @@ def main():
         args.demo = True
     
     # Create collector
-    collector = WeatherCollector(api_key=api_key, demo_mode=args.demo)
-    
-    # Collect weather data
-    if args.cities:
-        cities = args.cities.split(',')
-        print(f"\n🌤️  Weather Data Collector")
-        print(f"{'='*50}\n")
-        
-        results = collector.collect_weather_batch(cities)
-        
-        print(f"\n✓ Collected data for {len(results)} cities")
-    
-    # Export data
-    if args.export:
-        collector.export_data(format=args.export)
-    
-    # Default demo
-    if not args.cities and not args.export:
-        print("\n🌤️  Weather Data Collector - Demo Mode")
-        print(f"{'='*50}\n")
-        default_cities = ['London', 'Paris', 'Tokyo', 'New York', 'Sydney']
-        results = collector.collect_weather_batch(default_cities)
-        print(f"\n✓ Demo complete! Collected data for {len(results)} cities")
-        print("\nTry:")
-        print("  python weather_collector.py --cities 'Berlin,Madrid'")
-        print("  python weather_collector.py --export json")
+    with WeatherCollector(api_key=api_key, demo_mode=args.demo) as collector:
+        # Collect weather data
+        if args.cities:
+            cities = args.cities.split(',')
+            print(f"\n🌤️  Weather Data Collector")
+            print(f"{'='*50}\n")
+            
+            results = asyncio.run(collector.collect_weather_batch_async(cities))
+            
+            print(f"\n✓ Collected data for {len(results)} cities")
+        
+        # Export data
+        if args.export:
+            collector.export_data(format=args.export)
+        
+        # Default demo
+        if not args.cities and not args.export:
+            print("\n🌤️  Weather Data Collector - Demo Mode")
+            print(f"{'='*50}\n")
+            default_cities = ['London', 'Paris', 'Tokyo', 'New York', 'Sydney']
+            results = asyncio.run(collector.collect_weather_batch_async(default_cities))
+            print(f"\n✓ Demo complete! Collected data for {len(results)} cities")
+            print("\nTry:")
+            print("  python weather_collector.py --cities 'Berlin,Madrid'")
+            print("  python weather_collector.py --export json")
 
 
 if __name__ == "__main__":